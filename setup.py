@@ -9,10 +9,16 @@ setup(
     url="https://github.com/parkjs814/ticktick-mcp",
     packages=find_packages(),
     install_requires=[
-        "mcp[cli]>=1.2.0,<2.0.0",
+        "mcp[cli]>=1.3.0,<2.0.0",
+        "httpx>=0.27.0,<1.0.0",
+        "orjson>=3.9.0,<4.0.0",
+        "pydantic>=2.0.0,<3.0.0",
         "python-dotenv>=1.0.0,<2.0.0",
         "requests>=2.30.0,<3.0.0",
     ],
+    extras_require={
+        "speedups": ["ciso8601>=2.3.0,<3.0.0"],
+    },
     python_requires=">=3.10",
     entry_points={
         "console_scripts": [
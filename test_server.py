@@ -5,13 +5,19 @@ Simple test script to verify that the TickTick MCP server is configured correctl
 This will attempt to initialize the TickTick client and verify the credentials.
 """
 
+import asyncio
 import os
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
-from ticktick_mcp.src.ticktick_client import TickTickClient
+from ticktick_mcp.src.ticktick_client import TickTickAPIError, TickTickClient
 from ticktick_mcp.authenticate import main as auth_main
 
+async def fetch_projects(client: TickTickClient):
+    """Fetch projects and close the client's connections afterwards."""
+    async with client:
+        return await client.get_projects()
+
 def test_ticktick_connection():
     """Test the connection to TickTick API."""
     print("Testing TickTick MCP server configuration...")
@@ -53,9 +59,10 @@ def test_ticktick_connection():
         print("✅ Successfully initialized TickTick client.")
         
         # Test API connectivity
-        projects = client.get_projects()
-        if 'error' in projects:
-            print(f"❌ ERROR: Failed to fetch projects: {projects['error']}")
+        try:
+            projects = asyncio.run(fetch_projects(client))
+        except TickTickAPIError as e:
+            print(f"❌ ERROR: Failed to fetch projects: {e}")
             print("Your access token may have expired. Try running 'uv run -m ticktick_mcp.cli auth' to refresh it.")
             return False
         
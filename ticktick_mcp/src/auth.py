@@ -250,7 +250,7 @@ class TickTickAuth:
             return self.exchange_code_for_token()
             
         except Exception as e:
-            logger.error(f"Error during OAuth flow: {e}")
+            logger.error("Error during OAuth flow: %s", e)
             return f"Error during OAuth flow: {str(e)}"
         finally:
             # Clean up the server
@@ -301,7 +301,7 @@ class TickTickAuth:
             return "Authentication successful! Access token saved to .env file."
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error exchanging code for token: {e}")
+            logger.error("Error exchanging code for token: %s", e)
             if hasattr(e, 'response') and e.response is not None:
                 try:
                     error_details = e.response.json()
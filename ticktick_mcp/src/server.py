@@ -2,13 +2,22 @@ import asyncio
 import json
 import os
 import logging
+import re
+from contextlib import asynccontextmanager, suppress
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional
+from functools import lru_cache, wraps
+from typing import AsyncIterator, Dict, Iterator, List, Any, Optional
 
 from mcp.server.fastmcp import FastMCP
 from dotenv import load_dotenv
+from pydantic import BaseModel, ConfigDict
 
-from .ticktick_client import TickTickClient
+from .ticktick_client import TickTickAPIError, TickTickClient
+
+try:
+    import ciso8601
+except ImportError:  # Optional speedup, install with: pip install ticktick-mcp[speedups]
+    ciso8601 = None
 
 # Set up logging with more detail
 logging.basicConfig(
@@ -17,13 +26,40 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Create FastMCP server
-mcp = FastMCP("ticktick")
+# Maximum number of TickTick API requests issued concurrently by a single tool
+MAX_CONCURRENT_REQUESTS = 20
+
+# Display names for TickTick priority levels
+_PRIORITY_MAP = {0: "None", 1: "Low", 3: "Medium", 5: "High"}
+_VALID_PRIORITIES = frozenset(_PRIORITY_MAP)
+_VALID_VIEW_MODES = frozenset({"list", "kanban", "timeline"})
+
+# Checklist item icons, indexed by whether the item is complete (status 2)
+_CHECKLIST_ICONS = ("○", "✓")
+
+# ISO 8601 datetime with timezone, e.g. 2024-01-31T09:00:00+0000
+_ISO_RE = re.compile(r'^\d{4}-\d{2}-\d{2}T(?:[01]\d|2[0-3]):\d{2}:\d{2}(?:\.\d{1,6})?(?:Z|[+-]\d{2}:?\d{2})$')
+
+class TaskSpec(BaseModel):
+    """A task to create with create_tasks; fields match the create_task arguments."""
+    model_config = ConfigDict(extra="forbid")
+    
+    title: str
+    project_id: str
+    content: Optional[str] = None
+    desc: Optional[str] = None
+    start_date: Optional[str] = None
+    due_date: Optional[str] = None
+    priority: int = 0
+    tags: Optional[List[str]] = None
+    items: Optional[List[Dict[str, Any]]] = None
+    kind: Optional[str] = None
+    parent_id: Optional[str] = None
 
-# Create TickTick client
-ticktick = None
+# TickTick client, created once by the server lifespan hook
+ticktick: Optional[TickTickClient] = None
 
-def initialize_client():
+async def initialize_client():
     global ticktick
     try:
         # Check if .env file exists with access token
@@ -37,118 +73,215 @@ def initialize_client():
         # Initialize the client
         ticktick = TickTickClient()
         logger.info("TickTick client initialized successfully")
-        
-        # Test API connectivity
-        projects = ticktick.get_projects()
-        if 'error' in projects:
-            logger.error(f"Failed to access TickTick API: {projects['error']}")
-            logger.error("Your access token may have expired. Please run 'uv run -m ticktick_mcp.cli auth' to refresh it.")
-            return False
-            
-        logger.info(f"Successfully connected to TickTick API with {len(projects)} projects")
         return True
     except Exception as e:
-        logger.error(f"Failed to initialize TickTick client: {e}")
+        logger.error("Failed to initialize TickTick client: %s", e)
         return False
 
+async def check_connectivity() -> bool:
+    """Fetch the project list to verify that the TickTick API is reachable."""
+    try:
+        projects = await ticktick.get_projects()
+    except Exception as e:
+        logger.error("Failed to access TickTick API: %s", e)
+        logger.error("Your access token may have expired. Please run 'uv run -m ticktick_mcp.cli auth' to refresh it.")
+        return False
+    
+    logger.info("Successfully connected to TickTick API with %d projects", len(projects))
+    return True
+
+async def shutdown():
+    """Close the TickTick client and release its pooled connections."""
+    global ticktick
+    if ticktick:
+        await ticktick.aclose()
+        ticktick = None
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Set up the TickTick client when the server starts and close it on exit."""
+    probe = None
+    try:
+        if not await initialize_client():
+            raise RuntimeError("Failed to initialize TickTick client. Please check your API credentials.")
+        
+        # Optionally test API connectivity in the background, so the round-trip
+        # overlaps with server startup instead of delaying it
+        if os.getenv("TICKTICK_STARTUP_CHECK", "").lower() in ("1", "true", "yes"):
+            probe = asyncio.create_task(check_connectivity())
+        yield
+    finally:
+        if probe and not probe.done():
+            probe.cancel()
+            with suppress(asyncio.CancelledError):
+                await probe
+        await shutdown()
+
+# Create FastMCP server
+mcp = FastMCP("ticktick", lifespan=lifespan)
+
+@lru_cache(maxsize=256)
+def _validate_iso(date_str: str) -> bool:
+    """Check whether a date string is a valid ISO datetime in the format expected by TickTick."""
+    if not _ISO_RE.match(date_str):
+        return False
+    
+    # The regex only checks the shape; make sure the fields (including the
+    # timezone offset) are in range
+    try:
+        if ciso8601 is not None:
+            ciso8601.parse_datetime(date_str)
+        elif "." in date_str:
+            datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%S.%f%z")
+        else:
+            datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%S%z")
+    except (ValueError, OverflowError):
+        return False
+    return True
+
+def _validate_task_fields(priority: Optional[int], start_date: Optional[str], due_date: Optional[str]) -> Optional[str]:
+    """
+    Validate the priority and dates shared by the task creation and update tools.
+    
+    Returns:
+        An error message, or None if the fields are valid
+    """
+    if priority is not None and priority not in _VALID_PRIORITIES:
+        return "Invalid priority. Must be 0 (None), 1 (Low), 3 (Medium), or 5 (High)."
+    
+    for date_str, date_name in ((start_date, "start_date"), (due_date, "due_date")):
+        if date_str and not _validate_iso(date_str):
+            return f"Invalid {date_name} format. Use ISO format: YYYY-MM-DDThh:mm:ss+0000"
+    return None
+
 # Format a task object from TickTick for better display
 def format_task(task: Dict) -> str:
     """Format a task into a human-readable string."""
-    formatted = f"ID: {task.get('id', 'No ID')}\n"
-    formatted += f"Title: {task.get('title', 'No title')}\n"
-    
-    # Add project ID
-    formatted += f"Project ID: {task.get('projectId', 'None')}\n"
+    get = task.get
+    parts = [
+        f"ID: {get('id', 'No ID')}\n",
+        f"Title: {get('title', 'No title')}\n",
+        # Add project ID
+        f"Project ID: {get('projectId', 'None')}\n"
+    ]
     
     # Add dates if available
-    if task.get('startDate'):
-        formatted += f"Start Date: {task.get('startDate')}\n"
-    if task.get('dueDate'):
-        formatted += f"Due Date: {task.get('dueDate')}\n"
+    start_date = get('startDate')
+    if start_date:
+        parts.append(f"Start Date: {start_date}\n")
+    due_date = get('dueDate')
+    if due_date:
+        parts.append(f"Due Date: {due_date}\n")
     
     # Add priority if available
-    priority_map = {0: "None", 1: "Low", 3: "Medium", 5: "High"}
-    priority = task.get('priority', 0)
-    formatted += f"Priority: {priority_map.get(priority, str(priority))}\n"
+    priority = get('priority', 0)
+    parts.append(f"Priority: {_PRIORITY_MAP.get(priority) or str(priority)}\n")
     
     # Add status if available
-    status = "Completed" if task.get('status') == 2 else "Active"
-    formatted += f"Status: {status}\n"
+    status = "Completed" if get('status') == 2 else "Active"
+    parts.append(f"Status: {status}\n")
     
     # Add content if available
-    if task.get('content'):
-        formatted += f"\nContent:\n{task.get('content')}\n"
+    content = get('content')
+    if content:
+        parts.append(f"\nContent:\n{content}\n")
     
     # Add desc if available (for checklist tasks)
-    if task.get('desc'):
-        formatted += f"\nDescription:\n{task.get('desc')}\n"
+    desc = get('desc')
+    if desc:
+        parts.append(f"\nDescription:\n{desc}\n")
     
     # Add items if available (checklist items/subtasks)
-    items = task.get('items', [])
+    items = get('items') or ()
     if items:
-        formatted += f"\nChecklist Items ({len(items)}):\n"
-        for i, item in enumerate(items, 1):
-            status_icon = "✓" if item.get('status', 0) == 2 else "○"
-            formatted += f"  {status_icon} {item.get('title', 'Untitled item')}\n"
+        parts.append(f"\nChecklist Items ({len(items)}):\n")
+        for item in items:
+            status_icon = _CHECKLIST_ICONS[item.get('status', 0) == 2]
+            parts.append(f"  {status_icon} {item.get('title', 'Untitled item')}\n")
     
     # Add tags if available
-    tags = task.get('tags', [])
+    tags = get('tags')
     if tags:
-        formatted += f"\nTags: {', '.join(tags)}\n"
+        parts.append(f"\nTags: {', '.join(tags)}\n")
     
-    return formatted
+    return "".join(parts)
 
 # Format a project object from TickTick for better display
 def format_project(project: Dict) -> str:
     """Format a project into a human-readable string."""
-    formatted = f"Name: {project.get('name', 'No name')}\n"
-    formatted += f"ID: {project.get('id', 'No ID')}\n"
+    get = project.get
+    parts = [
+        f"Name: {get('name', 'No name')}\n",
+        f"ID: {get('id', 'No ID')}\n"
+    ]
     
     # Add color if available
-    if project.get('color'):
-        formatted += f"Color: {project.get('color')}\n"
+    color = get('color')
+    if color:
+        parts.append(f"Color: {color}\n")
     
     # Add view mode if available
-    if project.get('viewMode'):
-        formatted += f"View Mode: {project.get('viewMode')}\n"
+    view_mode = get('viewMode')
+    if view_mode:
+        parts.append(f"View Mode: {view_mode}\n")
     
     # Add closed status if available
     if 'closed' in project:
-        formatted += f"Closed: {'Yes' if project.get('closed') else 'No'}\n"
+        parts.append(f"Closed: {'Yes' if project['closed'] else 'No'}\n")
     
     # Add kind if available
-    if project.get('kind'):
-        formatted += f"Kind: {project.get('kind')}\n"
+    kind = get('kind')
+    if kind:
+        parts.append(f"Kind: {kind}\n")
+    
+    return "".join(parts)
+
+def _iter_tasks(tasks: List[Dict]) -> Iterator[str]:
+    """Yield a numbered, formatted entry for each task."""
+    for i, task in enumerate(tasks, 1):
+        yield f"Task {i}:\n{format_task(task)}\n"
+
+def _mcp_tool(action: str, api_action: Optional[str] = None):
+    """
+    Register a coroutine as an MCP tool with shared error handling.
     
-    return formatted
+    Args:
+        action: Description of the operation used in error messages (e.g. "retrieving projects")
+        api_action: Description used when the TickTick API request fails (defaults to action)
+    """
+    api_action = api_action or action
+    
+    def decorator(fn):
+        @mcp.tool()
+        @wraps(fn)
+        async def wrapper(*args, **kwargs) -> str:
+            try:
+                return await fn(*args, **kwargs)
+            except TickTickAPIError as e:
+                # Already logged by the client
+                return f"Error {api_action}: {e}"
+            except Exception as e:
+                logger.error("Error in %s: %s", fn.__name__, e)
+                return f"Error {action}: {str(e)}"
+        return wrapper
+    return decorator
 
 # MCP Tools
 
-@mcp.tool()
+@_mcp_tool("retrieving projects", "fetching projects")
 async def get_projects() -> str:
     """Get all projects from TickTick."""
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    projects = await ticktick.get_projects()
     
-    try:
-        projects = ticktick.get_projects()
-        if 'error' in projects:
-            return f"Error fetching projects: {projects['error']}"
-        
-        if not projects:
-            return "No projects found."
-        
-        result = f"Found {len(projects)} projects:\n\n"
-        for i, project in enumerate(projects, 1):
-            result += f"Project {i}:\n" + format_project(project) + "\n"
-        
-        return result
-    except Exception as e:
-        logger.error(f"Error in get_projects: {e}")
-        return f"Error retrieving projects: {str(e)}"
+    if not projects:
+        return "No projects found."
+    
+    chunks = [f"Found {len(projects)} projects:\n\n"]
+    chunks.extend(f"Project {i}:\n{format_project(project)}\n" for i, project in enumerate(projects, 1))
+    
+    return "".join(chunks)
 
-@mcp.tool()
+@_mcp_tool("retrieving project", "fetching project")
 async def get_project(project_id: str) -> str:
     """
     Get details about a specific project.
@@ -156,21 +289,11 @@ async def get_project(project_id: str) -> str:
     Args:
         project_id: ID of the project
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    project = await ticktick.get_project(project_id)
     
-    try:
-        project = ticktick.get_project(project_id)
-        if 'error' in project:
-            return f"Error fetching project: {project['error']}"
-        
-        return format_project(project)
-    except Exception as e:
-        logger.error(f"Error in get_project: {e}")
-        return f"Error retrieving project: {str(e)}"
+    return format_project(project)
 
-@mcp.tool()
+@_mcp_tool("retrieving project tasks", "fetching project data")
 async def get_project_tasks(project_id: str) -> str:
     """
     Get all tasks in a specific project.
@@ -178,29 +301,47 @@ async def get_project_tasks(project_id: str) -> str:
     Args:
         project_id: ID of the project
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    project_data = await ticktick.get_project_with_data(project_id)
+    project_name = (project_data.get('project') or {}).get('name', project_id)
     
-    try:
-        project_data = ticktick.get_project_with_data(project_id)
-        if 'error' in project_data:
-            return f"Error fetching project data: {project_data['error']}"
-        
-        tasks = project_data.get('tasks', [])
-        if not tasks:
-            return f"No tasks found in project '{project_data.get('project', {}).get('name', project_id)}'."
-        
-        result = f"Found {len(tasks)} tasks in project '{project_data.get('project', {}).get('name', project_id)}':\n\n"
-        for i, task in enumerate(tasks, 1):
-            result += f"Task {i}:\n" + format_task(task) + "\n"
+    tasks = project_data.get('tasks') or ()
+    if not tasks:
+        return f"No tasks found in project '{project_name}'."
+    
+    header = f"Found {len(tasks)} tasks in project '{project_name}':\n\n"
+    return "".join([header, *_iter_tasks(tasks)])
+
+@_mcp_tool("retrieving all project tasks", "fetching projects")
+async def get_all_project_tasks() -> str:
+    """Get all tasks across every project in TickTick."""
+    projects = await ticktick.get_projects()
+    
+    if not projects:
+        return "No projects found."
+    
+    # Fetch all projects concurrently, bounded to avoid hitting rate limits
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    
+    async def fetch(project_id: str) -> Dict:
+        async with semaphore:
+            return await ticktick.get_project_with_data(project_id)
+    
+    results = await asyncio.gather(*(fetch(project['id']) for project in projects), return_exceptions=True)
+    
+    chunks = [f"Found {len(projects)} projects:\n\n"]
+    for project, project_data in zip(projects, results):
+        name = project.get('name', project['id'])
+        if isinstance(project_data, Exception):
+            chunks.append(f"Error fetching tasks for project '{name}': {project_data}\n\n")
+            continue
         
-        return result
-    except Exception as e:
-        logger.error(f"Error in get_project_tasks: {e}")
-        return f"Error retrieving project tasks: {str(e)}"
+        tasks = project_data.get('tasks') or ()
+        chunks.append(f"Project '{name}' ({len(tasks)} tasks):\n\n")
+        chunks.extend(_iter_tasks(tasks))
+    
+    return "".join(chunks)
 
-@mcp.tool()
+@_mcp_tool("retrieving task", "fetching task")
 async def get_task(project_id: str, task_id: str) -> str:
     """
     Get details about a specific task.
@@ -209,21 +350,80 @@ async def get_task(project_id: str, task_id: str) -> str:
         project_id: ID of the project
         task_id: ID of the task
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    task = await ticktick.get_task(project_id, task_id)
     
-    try:
-        task = ticktick.get_task(project_id, task_id)
-        if 'error' in task:
-            return f"Error fetching task: {task['error']}"
-        
-        return format_task(task)
-    except Exception as e:
-        logger.error(f"Error in get_task: {e}")
-        return f"Error retrieving task: {str(e)}"
+    return format_task(task)
+
+async def _submit_task(
+    title: str,
+    project_id: str,
+    content: str = None,
+    desc: str = None,
+    start_date: str = None,
+    due_date: str = None,
+    priority: int = 0,
+    tags: List[str] = None,
+    items: List[Dict[str, Any]] = None,
+    kind: str = None,
+    parent_id: str = None
+) -> Dict:
+    """Send a new task to TickTick and return the created task."""
+    # For checklists, we should use desc and NOT content
+    if desc and items:
+        # This is a checklist - don't include content
+        content = None
+        kind = None
+    
+    return await ticktick.create_task(
+        title=title,
+        project_id=project_id,
+        content=content,
+        desc=desc,
+        start_date=start_date,
+        due_date=due_date,
+        priority=priority,
+        tags=tags,
+        items=items,
+        kind=kind,
+        parent_id=parent_id,
+        is_all_day=False  # Important for checklists
+    )
+
+async def _create_task_impl(
+    title: str,
+    project_id: str,
+    content: str = None,
+    desc: str = None,
+    start_date: str = None,
+    due_date: str = None,
+    priority: int = 0,
+    tags: List[str] = None,
+    items: List[Dict[str, Any]] = None,
+    kind: str = None,
+    parent_id: str = None
+) -> str:
+    """Validate and create a task; shared by the task creation tools."""
+    # Validate priority and dates
+    if error := _validate_task_fields(priority, start_date, due_date):
+        return error
+    
+    task = await _submit_task(
+        title=title,
+        project_id=project_id,
+        content=content,
+        desc=desc,
+        start_date=start_date,
+        due_date=due_date,
+        priority=priority,
+        tags=tags,
+        items=items,
+        kind=kind,
+        parent_id=parent_id
+    )
+    
+    return f"Task created successfully:\n\n" + format_task(task)
 
-@mcp.tool()
+@_mcp_tool("creating task")
 async def create_task(
     title: str, 
     project_id: str, 
@@ -253,65 +453,82 @@ async def create_task(
         kind: Task type - "CHECKLIST" for checklist tasks (optional)
         parent_id: ID of the parent task to create this as a subtask (optional)
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
-    
-    # Validate priority
-    if priority not in [0, 1, 3, 5]:
-        return "Invalid priority. Must be 0 (None), 1 (Low), 3 (Medium), or 5 (High)."
+    return await _create_task_impl(
+        title=title,
+        project_id=project_id,
+        content=content,
+        desc=desc,
+        start_date=start_date,
+        due_date=due_date,
+        priority=priority,
+        tags=tags,
+        items=items,
+        kind=kind,
+        parent_id=parent_id
+    )
+
+@_mcp_tool("creating tasks")
+async def create_tasks(tasks: List[TaskSpec]) -> str:
+    """
+    Create multiple tasks in TickTick at once.
     
-    try:
-        # Validate dates if provided
-        for date_str, date_name in [(start_date, "start_date"), (due_date, "due_date")]:
-            if date_str:
-                try:
-                    # Try to parse the date to validate it
-                    datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                except ValueError:
-                    return f"Invalid {date_name} format. Use ISO format: YYYY-MM-DDThh:mm:ss+0000"
-        
-        # For checklists, we should use desc and NOT content
-        if desc and items:
-            # This is a checklist - don't include content
-            task = ticktick.create_task(
-                title=title,
-                project_id=project_id,
-                desc=desc,
-                start_date=start_date,
-                due_date=due_date,
-                priority=priority,
-                tags=tags,
-                items=items,
-                parent_id=parent_id,
-                is_all_day=False  # Important for checklists
-            )
+    Args:
+        tasks: List of tasks, each with the same fields as create_task
+               ('title' and 'project_id' are required; 'content', 'desc', 'start_date',
+               'due_date', 'priority', 'tags', 'items', 'kind' and 'parent_id' are optional)
+    """
+    if not tasks:
+        return "No tasks provided."
+    
+    # Validate every task before creating any of them
+    for i, task in enumerate(tasks, 1):
+        if not task.title or not task.project_id:
+            return f"Invalid task {i}: 'title' and 'project_id' are required."
+        if error := _validate_task_fields(task.priority, task.start_date, task.due_date):
+            return f"Task {i}: {error}"
+    
+    # Create the tasks concurrently, bounded to avoid hitting rate limits
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    
+    async def create(task: TaskSpec) -> Dict:
+        async with semaphore:
+            return await _submit_task(**task.model_dump())
+    
+    results = await asyncio.gather(*(create(task) for task in tasks), return_exceptions=True)
+    
+    created = 0
+    chunks = []
+    for i, result in enumerate(results, 1):
+        if isinstance(result, Exception):
+            chunks.append(f"Task {i}: Error creating task: {result}\n\n")
         else:
-            # Regular task
-            task = ticktick.create_task(
-                title=title,
-                project_id=project_id,
-                content=content,
-                desc=desc,
-                start_date=start_date,
-                due_date=due_date,
-                priority=priority,
-                tags=tags,
-                items=items,
-                kind=kind,
-                parent_id=parent_id,
-                is_all_day=False
-            )
-        
-        if 'error' in task:
-            return f"Error creating task: {task['error']}"
-        
-        return f"Task created successfully:\n\n" + format_task(task)
-    except Exception as e:
-        logger.error(f"Error in create_task: {e}")
-        return f"Error creating task: {str(e)}"
+            created += 1
+            chunks.append(f"Task {i}:\n{format_task(result)}\n")
+    
+    return "".join([f"Created {created} of {len(tasks)} tasks:\n\n", *chunks])
+
+async def _create_checklist_impl(
+    title: str,
+    project_id: str,
+    desc: str,
+    items: List[Dict[str, Any]],
+    priority: int = 0,
+    tags: List[str] = None
+) -> str:
+    """Create a checklist task; shared by the checklist creation tools."""
+    # Create the checklist - use desc instead of content for checklists
+    task = await _submit_task(
+        title=title,
+        project_id=project_id,
+        desc=desc,  # desc makes it a checklist
+        priority=priority,
+        tags=tags,
+        items=items
+    )
+    
+    return f"Checklist created successfully:\n\n" + format_task(task)
 
-@mcp.tool()
+@_mcp_tool("creating checklist")
 async def create_checklist(
     title: str,
     project_id: str,
@@ -334,31 +551,16 @@ async def create_checklist(
         priority: Priority level (0: None, 1: Low, 3: Medium, 5: High) (optional)
         tags: List of tags to add to the checklist (optional)
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
-    
-    try:
-        # Create the checklist - use desc instead of content for checklists
-        task = ticktick.create_task(
-            title=title,
-            project_id=project_id,
-            desc=desc,  # desc makes it a checklist
-            priority=priority,
-            tags=tags,
-            items=items,
-            is_all_day=False  # Important for checklists
-        )
-        
-        if 'error' in task:
-            return f"Error creating checklist: {task['error']}"
-        
-        return f"Checklist created successfully:\n\n" + format_task(task)
-    except Exception as e:
-        logger.error(f"Error in create_checklist: {e}")
-        return f"Error creating checklist: {str(e)}"
+    return await _create_checklist_impl(
+        title=title,
+        project_id=project_id,
+        desc=desc,
+        items=items,
+        priority=priority,
+        tags=tags
+    )
 
-@mcp.tool()
+@_mcp_tool("creating task")
 async def create_basic_task(
     title: str, 
     project_id: str, 
@@ -380,7 +582,7 @@ async def create_basic_task(
         priority: Priority level (0: None, 1: Low, 3: Medium, 5: High) (optional)
         tags: List of tags to add to the task (optional)
     """
-    return await create_task(
+    return await _create_task_impl(
         title=title,
         project_id=project_id,
         content=content,
@@ -390,7 +592,7 @@ async def create_basic_task(
         tags=tags
     )
 
-@mcp.tool()
+@_mcp_tool("creating task")
 async def create_subtask(
     title: str,
     project_id: str,
@@ -414,7 +616,7 @@ async def create_subtask(
         priority: Priority level (0: None, 1: Low, 3: Medium, 5: High) (optional)
         tags: List of tags to add to the task (optional)
     """
-    return await create_task(
+    return await _create_task_impl(
         title=title,
         project_id=project_id,
         parent_id=parent_task_id,
@@ -425,7 +627,7 @@ async def create_subtask(
         tags=tags
     )
 
-@mcp.tool()
+@_mcp_tool("creating checklist")
 async def create_checklist_task(
     title: str,
     project_id: str,
@@ -446,7 +648,7 @@ async def create_checklist_task(
     # Convert simple string list to proper item format
     formatted_items = [{"title": item, "status": 0} for item in items]
     
-    return await create_checklist(
+    return await _create_checklist_impl(
         title=title,
         project_id=project_id,
         desc=title,  # Use title as description for consistency
@@ -455,7 +657,7 @@ async def create_checklist_task(
         tags=tags
     )
 
-@mcp.tool()
+@_mcp_tool("updating task")
 async def update_task(
     task_id: str,
     project_id: str,
@@ -483,46 +685,26 @@ async def update_task(
         tags: New list of tags for the task (optional)
         items: New list of checklist items, each with 'title' and optional 'status' (0: incomplete, 2: complete) (optional)
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    # Validate priority and dates if provided
+    if error := _validate_task_fields(priority, start_date, due_date):
+        return error
     
-    # Validate priority if provided
-    if priority is not None and priority not in [0, 1, 3, 5]:
-        return "Invalid priority. Must be 0 (None), 1 (Low), 3 (Medium), or 5 (High)."
+    task = await ticktick.update_task(
+        task_id=task_id,
+        project_id=project_id,
+        title=title,
+        content=content,
+        desc=desc,
+        start_date=start_date,
+        due_date=due_date,
+        priority=priority,
+        tags=tags,
+        items=items
+    )
     
-    try:
-        # Validate dates if provided
-        for date_str, date_name in [(start_date, "start_date"), (due_date, "due_date")]:
-            if date_str:
-                try:
-                    # Try to parse the date to validate it
-                    datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                except ValueError:
-                    return f"Invalid {date_name} format. Use ISO format: YYYY-MM-DDThh:mm:ss+0000"
-        
-        task = ticktick.update_task(
-            task_id=task_id,
-            project_id=project_id,
-            title=title,
-            content=content,
-            desc=desc,
-            start_date=start_date,
-            due_date=due_date,
-            priority=priority,
-            tags=tags,
-            items=items
-        )
-        
-        if 'error' in task:
-            return f"Error updating task: {task['error']}"
-        
-        return f"Task updated successfully:\n\n" + format_task(task)
-    except Exception as e:
-        logger.error(f"Error in update_task: {e}")
-        return f"Error updating task: {str(e)}"
+    return f"Task updated successfully:\n\n" + format_task(task)
 
-@mcp.tool()
+@_mcp_tool("completing task")
 async def complete_task(project_id: str, task_id: str) -> str:
     """
     Mark a task as complete.
@@ -531,21 +713,10 @@ async def complete_task(project_id: str, task_id: str) -> str:
         project_id: ID of the project
         task_id: ID of the task
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
-    
-    try:
-        result = ticktick.complete_task(project_id, task_id)
-        if 'error' in result:
-            return f"Error completing task: {result['error']}"
-        
-        return f"Task {task_id} marked as complete."
-    except Exception as e:
-        logger.error(f"Error in complete_task: {e}")
-        return f"Error completing task: {str(e)}"
+    await ticktick.complete_task(project_id, task_id)
+    return f"Task {task_id} marked as complete."
 
-@mcp.tool()
+@_mcp_tool("deleting task")
 async def delete_task(project_id: str, task_id: str) -> str:
     """
     Delete a task.
@@ -554,21 +725,10 @@ async def delete_task(project_id: str, task_id: str) -> str:
         project_id: ID of the project
         task_id: ID of the task
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
-    
-    try:
-        result = ticktick.delete_task(project_id, task_id)
-        if 'error' in result:
-            return f"Error deleting task: {result['error']}"
-        
-        return f"Task {task_id} deleted successfully."
-    except Exception as e:
-        logger.error(f"Error in delete_task: {e}")
-        return f"Error deleting task: {str(e)}"
+    await ticktick.delete_task(project_id, task_id)
+    return f"Task {task_id} deleted successfully."
 
-@mcp.tool()
+@_mcp_tool("creating project")
 async def create_project(
     name: str,
     color: str = "#F18181",
@@ -582,30 +742,19 @@ async def create_project(
         color: Color code (hex format) (optional)
         view_mode: View mode - one of list, kanban, or timeline (optional)
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
-    
     # Validate view_mode
-    if view_mode not in ["list", "kanban", "timeline"]:
+    if view_mode not in _VALID_VIEW_MODES:
         return "Invalid view_mode. Must be one of: list, kanban, timeline."
     
-    try:
-        project = ticktick.create_project(
-            name=name,
-            color=color,
-            view_mode=view_mode
-        )
-        
-        if 'error' in project:
-            return f"Error creating project: {project['error']}"
-        
-        return f"Project created successfully:\n\n" + format_project(project)
-    except Exception as e:
-        logger.error(f"Error in create_project: {e}")
-        return f"Error creating project: {str(e)}"
+    project = await ticktick.create_project(
+        name=name,
+        color=color,
+        view_mode=view_mode
+    )
+    
+    return f"Project created successfully:\n\n" + format_project(project)
 
-@mcp.tool()
+@_mcp_tool("deleting project")
 async def delete_project(project_id: str) -> str:
     """
     Delete a project.
@@ -613,28 +762,12 @@ async def delete_project(project_id: str) -> str:
     Args:
         project_id: ID of the project
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
-    
-    try:
-        result = ticktick.delete_project(project_id)
-        if 'error' in result:
-            return f"Error deleting project: {result['error']}"
-        
-        return f"Project {project_id} deleted successfully."
-    except Exception as e:
-        logger.error(f"Error in delete_project: {e}")
-        return f"Error deleting project: {str(e)}"
+    await ticktick.delete_project(project_id)
+    return f"Project {project_id} deleted successfully."
 
 def main():
     """Main entry point for the MCP server."""
-    # Initialize the TickTick client
-    if not initialize_client():
-        logger.error("Failed to initialize TickTick client. Please check your API credentials.")
-        return
-    
-    # Run the server
+    # Run the server (the TickTick client is initialized in the lifespan hook)
     mcp.run(transport='stdio')
 
 if __name__ == "__main__":
@@ -1,10 +1,12 @@
+import asyncio
 import os
-import json
 import base64
-import requests
+import httpx
+import orjson
 import logging
 import random
 import string
+import time
 from pathlib import Path
 from dotenv import load_dotenv
 from typing import Dict, List, Any, Optional, Tuple
@@ -13,6 +15,12 @@ from datetime import datetime, timezone
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Seconds for which project lookups are served from the in-process cache
+PROJECTS_CACHE_TTL = 30.0
+
+class TickTickAPIError(Exception):
+    """Raised when a request to the TickTick API fails."""
+
 class TickTickClient:
     """
     Client for the TickTick API using OAuth2 authentication.
@@ -37,8 +45,35 @@ class TickTickClient:
             "Accept-Encoding": None,
             "User-Agent": 'curl/8.7.1'
         }
+        
+        # Persistent HTTP client so connections are reused across tool calls
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={k: v for k, v in self.headers.items() if v is not None},
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        )
+        # httpx adds Accept-Encoding by default; drop it to match the headers above
+        del self._client.headers["Accept-Encoding"]
+        
+        # Serializes token refreshes when several requests hit a 401 concurrently
+        self._refresh_lock = asyncio.Lock()
+        
+        # Short-lived caches for project lookups, stored as (fetched_at, data)
+        self._projects_cache: Optional[Tuple[float, List[Dict]]] = None
+        self._project_cache: Dict[str, Tuple[float, Dict]] = {}
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        await self._client.aclose()
+    
+    async def __aenter__(self) -> "TickTickClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
     
-    def _refresh_access_token(self) -> bool:
+    async def _refresh_access_token(self) -> bool:
         """
         Refresh the access token using the refresh token.
         
@@ -71,11 +106,11 @@ class TickTickClient:
         
         try:
             # Send the token request
-            response = requests.post(self.token_url, data=token_data, headers=headers)
+            response = await self._client.post(self.token_url, data=token_data, headers=headers)
             response.raise_for_status()
             
             # Parse the response
-            tokens = response.json()
+            tokens = orjson.loads(response.content)
             
             # Update the tokens
             self.access_token = tokens.get('access_token')
@@ -84,6 +119,7 @@ class TickTickClient:
                 
             # Update the headers
             self.headers["Authorization"] = f"Bearer {self.access_token}"
+            self._client.headers["Authorization"] = f"Bearer {self.access_token}"
             
             # Save the tokens to the .env file
             self._save_tokens_to_env(tokens)
@@ -91,8 +127,8 @@ class TickTickClient:
             logger.info("Access token refreshed successfully.")
             return True
             
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error refreshing access token: {e}")
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+            logger.error("Error refreshing access token: %s", e)
             return False
     
     def _save_tokens_to_env(self, tokens: Dict[str, str]) -> None:
@@ -132,86 +168,106 @@ class TickTickClient:
         
         logger.debug("Tokens saved to .env file")
     
-    def _make_request(self, method: str, endpoint: str, data=None) -> Dict:
+    async def _make_request(self, method: str, endpoint: str, data=None) -> Dict:
         """
         Makes a request to the TickTick API.
         
         Args:
-            method: HTTP method (GET, POST, PUT, DELETE)
+            method: HTTP method (GET, POST, DELETE)
             endpoint: API endpoint (without base URL)
-            data: Request data (for POST, PUT)
+            data: Request data (for POST)
         
         Returns:
             API response as a dictionary
+        
+        Raises:
+            TickTickAPIError: If the request fails
         """
-        url = f"{self.base_url}{endpoint}"
+        if method not in ("GET", "POST", "DELETE"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
         
         # Log the request details
-        logger.info(f"Making {method} request to: {url}")
-        if data:
-            logger.info(f"Request data: {json.dumps(data, indent=2)}")
+        logger.info("Making %s request to: %s%s", method, self.base_url, endpoint)
+        if data and logger.isEnabledFor(logging.INFO):
+            logger.info("Request data: %s", orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
+        
+        # Serialize the body once; it is reused if the request has to be retried
+        body = orjson.dumps(data) if data is not None else None
         
         try:
-            # Make the request
-            if method == "GET":
-                response = requests.get(url, headers=self.headers)
-            elif method == "POST":
-                response = requests.post(url, headers=self.headers, json=data)
-            elif method == "DELETE":
-                response = requests.delete(url, headers=self.headers)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+            # Make the request, remembering which token it was sent with
+            sent_token = self.access_token
+            response = await self._client.request(method, endpoint, content=body)
             
             # Check if the request was unauthorized (401)
             if response.status_code == 401:
-                logger.info("Access token expired. Attempting to refresh...")
+                async with self._refresh_lock:
+                    if self.access_token != sent_token:
+                        # Another request already refreshed the token while this one was in flight
+                        refreshed = True
+                    else:
+                        logger.info("Access token expired. Attempting to refresh...")
+                        refreshed = await self._refresh_access_token()
                 
-                # Try to refresh the access token
-                if self._refresh_access_token():
+                if refreshed:
                     # Retry the request with the new token
-                    if method == "GET":
-                        response = requests.get(url, headers=self.headers)
-                    elif method == "POST":
-                        response = requests.post(url, headers=self.headers, json=data)
-                    elif method == "DELETE":
-                        response = requests.delete(url, headers=self.headers)
+                    response = await self._client.request(method, endpoint, content=body)
             
             # Log response details
-            logger.info(f"Response status code: {response.status_code}")
-            logger.info(f"Response headers: {dict(response.headers)}")
-            
-            # Log response body if not too large
-            if response.text and len(response.text) < 5000:
-                logger.info(f"Response body: {response.text}")
-            elif response.text:
-                logger.info(f"Response body (truncated): {response.text[:1000]}...")
+            logger.info("Response status code: %s", response.status_code)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Response headers: %s", dict(response.headers))
+                
+                # Log response body if not too large
+                if response.text and len(response.text) < 5000:
+                    logger.info("Response body: %s", response.text)
+                elif response.text:
+                    logger.info("Response body (truncated): %s...", response.text[:1000])
             
             # Raise an exception for 4xx/5xx status codes
             response.raise_for_status()
             
             # Return empty dict for 204 No Content
-            if response.status_code == 204 or response.text == "":
+            if response.status_code == 204 or not response.content:
                 return {}
             
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logger.error(f"API request failed: {e}")
-            return {"error": str(e)}
+            return orjson.loads(response.content)
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+            logger.error("API request failed: %s", e)
+            raise TickTickAPIError(str(e)) from e
     
     # Project methods
-    def get_projects(self) -> List[Dict]:
-        """Gets all projects for the user."""
-        return self._make_request("GET", "/project")
+    def invalidate_projects(self) -> None:
+        """Drops cached project lookups so the next call fetches fresh data."""
+        self._projects_cache = None
+        self._project_cache.clear()
     
-    def get_project(self, project_id: str) -> Dict:
-        """Gets a specific project by ID."""
-        return self._make_request("GET", f"/project/{project_id}")
+    async def get_projects(self) -> List[Dict]:
+        """Gets all projects for the user (cached for PROJECTS_CACHE_TTL seconds)."""
+        now = time.monotonic()
+        if self._projects_cache and now - self._projects_cache[0] < PROJECTS_CACHE_TTL:
+            return self._projects_cache[1]
+        
+        projects = await self._make_request("GET", "/project")
+        self._projects_cache = (now, projects)
+        return projects
+    
+    async def get_project(self, project_id: str) -> Dict:
+        """Gets a specific project by ID (cached for PROJECTS_CACHE_TTL seconds)."""
+        now = time.monotonic()
+        cached = self._project_cache.get(project_id)
+        if cached and now - cached[0] < PROJECTS_CACHE_TTL:
+            return cached[1]
+        
+        project = await self._make_request("GET", f"/project/{project_id}")
+        self._project_cache[project_id] = (now, project)
+        return project
     
-    def get_project_with_data(self, project_id: str) -> Dict:
+    async def get_project_with_data(self, project_id: str) -> Dict:
         """Gets project with tasks and columns."""
-        return self._make_request("GET", f"/project/{project_id}/data")
+        return await self._make_request("GET", f"/project/{project_id}/data")
     
-    def create_project(self, name: str, color: str = "#F18181", view_mode: str = "list", kind: str = "TASK") -> Dict:
+    async def create_project(self, name: str, color: str = "#F18181", view_mode: str = "list", kind: str = "TASK") -> Dict:
         """Creates a new project."""
         data = {
             "name": name,
@@ -219,9 +275,11 @@ class TickTickClient:
             "viewMode": view_mode,
             "kind": kind
         }
-        return self._make_request("POST", "/project", data)
+        project = await self._make_request("POST", "/project", data)
+        self.invalidate_projects()
+        return project
     
-    def update_project(self, project_id: str, name: str = None, color: str = None, 
+    async def update_project(self, project_id: str, name: str = None, color: str = None, 
                        view_mode: str = None, kind: str = None) -> Dict:
         """Updates an existing project."""
         data = {}
@@ -234,18 +292,22 @@ class TickTickClient:
         if kind:
             data["kind"] = kind
             
-        return self._make_request("POST", f"/project/{project_id}", data)
+        project = await self._make_request("POST", f"/project/{project_id}", data)
+        self.invalidate_projects()
+        return project
     
-    def delete_project(self, project_id: str) -> Dict:
+    async def delete_project(self, project_id: str) -> Dict:
         """Deletes a project."""
-        return self._make_request("DELETE", f"/project/{project_id}")
+        result = await self._make_request("DELETE", f"/project/{project_id}")
+        self.invalidate_projects()
+        return result
     
     # Task methods
-    def get_task(self, project_id: str, task_id: str) -> Dict:
+    async def get_task(self, project_id: str, task_id: str) -> Dict:
         """Gets a specific task by project ID and task ID."""
-        return self._make_request("GET", f"/project/{project_id}/task/{task_id}")
+        return await self._make_request("GET", f"/project/{project_id}/task/{task_id}")
     
-    def create_task(self, title: str, project_id: str, content: str = None, 
+    async def create_task(self, title: str, project_id: str, content: str = None, 
                    desc: str = None, start_date: str = None, due_date: str = None, 
                    priority: int = 0, is_all_day: bool = False, tags: List[str] = None,
                    items: List[Dict[str, Any]] = None, kind: str = None, parent_id: str = None) -> Dict:
@@ -280,9 +342,9 @@ class TickTickClient:
         if parent_id is not None:
             data["parentId"] = parent_id
             
-        return self._make_request("POST", "/task", data)
+        return await self._make_request("POST", "/task", data)
     
-    def update_task(self, task_id: str, project_id: str, title: str = None, 
+    async def update_task(self, task_id: str, project_id: str, title: str = None, 
                    content: str = None, desc: str = None, priority: int = None, 
                    start_date: str = None, due_date: str = None, tags: List[str] = None,
                    items: List[Dict[str, Any]] = None) -> Dict:
@@ -309,12 +371,12 @@ class TickTickClient:
         if items is not None:
             data["items"] = items
             
-        return self._make_request("POST", f"/task/{task_id}", data)
+        return await self._make_request("POST", f"/task/{task_id}", data)
     
-    def complete_task(self, project_id: str, task_id: str) -> Dict:
+    async def complete_task(self, project_id: str, task_id: str) -> Dict:
         """Marks a task as complete."""
-        return self._make_request("POST", f"/project/{project_id}/task/{task_id}/complete")
+        return await self._make_request("POST", f"/project/{project_id}/task/{task_id}/complete")
     
-    def delete_task(self, project_id: str, task_id: str) -> Dict:
+    async def delete_task(self, project_id: str, task_id: str) -> Dict:
         """Deletes a task."""
-        return self._make_request("DELETE", f"/project/{project_id}/task/{task_id}")
\ No newline at end of file
+        return await self._make_request("DELETE", f"/project/{project_id}/task/{task_id}")
\ No newline at end of file